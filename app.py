@@ -4,17 +4,25 @@ import matplotlib.pyplot as plt
 import base64
 from fpdf import FPDF
 from scripts.data_loader import load_running_data
+from scripts.pace_sketches import load_pace_sketch
+from scripts.daily_rollups import load_daily_rollups, summarize_rollups
 from scripts.visualization import (
+    COMPARISON_METRICS,
     plot_fastest_pace_per_shoe,
     plot_monthly_trends,
     plot_shoes_usage,
     plot_elevation_gain,
-    plot_monthly_distance
+    plot_monthly_distance,
+    plot_pace_distribution,
+    plot_year_over_year,
+    plot_period_comparison
 )
 from io import BytesIO
+from datetime import date, timedelta
 import tempfile
 
 df = None
+selected_shoe = "All"
 
 st.title("🏃🏻‍♀️ Running Data Dashboard")
 
@@ -56,6 +64,18 @@ try:
         fastest_pace_fig = plot_fastest_pace_per_shoe(df)
         st.pyplot(fastest_pace_fig)
 
+        # Pace distribution from the stored sketches (no raw history needed)
+        pace_distribution_fig = None
+        pace_sketch = load_pace_sketch(
+            shoes=shoes_list[1:] if selected_shoe == "All" else selected_shoe,
+            start_month="2024-01",
+            end_month="2024-12"
+        )
+        if pace_sketch.count:
+            st.subheader("📈 Pace Distribution")
+            pace_distribution_fig = plot_pace_distribution(pace_sketch)
+            st.pyplot(pace_distribution_fig)
+
         # Only show shoes usage for ALL
         shoes_usage_fig = None  
         if selected_shoe == "All":
@@ -66,6 +86,55 @@ try:
 except Exception as e:
     st.error(f"An error occurred: {e}")
 
+# Comparison mode, served from the daily rollups (independent of the 2024 data)
+try:
+    # "All" = every known shoe, including ones retired before 2024
+    comparison_shoes = None if selected_shoe == "All" else selected_shoe
+    comparison_mode = st.sidebar.selectbox("Comparison", ["Off", "Year over Year", "Two Date Ranges"], index=0)
+
+    if comparison_mode == "Year over Year":
+        metric = st.sidebar.selectbox("Metric", list(COMPARISON_METRICS.keys()),
+                                      format_func=lambda m: COMPARISON_METRICS[m])
+        period = st.sidebar.selectbox("Period", ["month", "week"])
+
+        rollups = load_daily_rollups(shoes=comparison_shoes)
+        if rollups.empty:
+            st.warning("No daily rollups found. Run scripts/daily_rollups.py to build them.")
+        else:
+            if period == "month":
+                rollups['year'] = rollups['date'].dt.year
+                rollups['period'] = rollups['date'].dt.month
+            else:
+                # ISO weeks can start in the previous/next calendar year
+                iso_calendar = rollups['date'].dt.isocalendar()
+                rollups['year'] = iso_calendar.year.astype(int)
+                rollups['period'] = iso_calendar.week.astype(int)
+
+            st.subheader("📅 Year over Year")
+            year_over_year_fig = plot_year_over_year(summarize_rollups(rollups, by=['year', 'period']), metric, period)
+            st.pyplot(year_over_year_fig)
+
+    elif comparison_mode == "Two Date Ranges":
+        range_a = st.sidebar.date_input("Period A", (date(2024, 1, 1), date(2024, 6, 30)))
+        range_b = st.sidebar.date_input("Period B", (date(2024, 7, 1), date(2024, 12, 31)))
+
+        if len(range_a) == 2 and len(range_b) == 2:
+            # End dates are inclusive in the picker
+            rollups_a = load_daily_rollups(range_a[0], range_a[1] + timedelta(days=1), comparison_shoes)
+            rollups_b = load_daily_rollups(range_b[0], range_b[1] + timedelta(days=1), comparison_shoes)
+
+            if rollups_a.empty or rollups_b.empty:
+                st.warning("No runs found in the daily rollups for one of the periods. Run scripts/daily_rollups.py if they have not been built yet.")
+            else:
+                st.subheader("📅 Period Comparison")
+                st.write(f"Period A: {range_a[0]} - {range_a[1]} | Period B: {range_b[0]} - {range_b[1]}")
+                period_comparison_fig = plot_period_comparison(summarize_rollups(rollups_a), summarize_rollups(rollups_b),
+                                                               "Period A", "Period B")
+                st.pyplot(period_comparison_fig)
+
+except Exception as e:
+    st.error(f"An error occurred: {e}")
+
 # Generate CSV for download
 if df is not None and not df.empty:
     csv = df.to_csv(index=False)
@@ -100,6 +169,12 @@ if df is not None and not df.empty:
     monthly_distance_temp = save_image_to_tempfile(monthly_distance_img)
     fastest_pace_temp = save_image_to_tempfile(fastest_pace_img)
 
+    # Only save pace distribution if it exists
+    pace_distribution_temp = None
+    if pace_distribution_fig:
+        pace_distribution_img = save_plot_to_bytes(pace_distribution_fig)
+        pace_distribution_temp = save_image_to_tempfile(pace_distribution_img)
+
     # Only save shoes usage if it exists
     shoes_usage_temp = None
     if shoes_usage_fig:
@@ -118,6 +193,9 @@ if df is not None and not df.empty:
     add_image_to_new_page(pdf, monthly_distance_temp)
     add_image_to_new_page(pdf, fastest_pace_temp)
 
+    if pace_distribution_temp:
+        add_image_to_new_page(pdf, pace_distribution_temp)
+
     if shoes_usage_temp:
         add_image_to_new_page(pdf, shoes_usage_temp)
 
@@ -2,6 +2,8 @@ import os
 import pymongo
 import pandas as pd
 from datetime import datetime
+from pace_sketches import update_pace_sketches
+from daily_rollups import update_daily_rollups
 
 uri = os.getenv("MongoDB_ConnectionString")  # Fetch URI from ENV VAR
 
@@ -30,6 +32,7 @@ except Exception as e:
     exit()
 
 # Process the CSV file to filter running activities
+uploaded_activities = []
 for index, row in df.iterrows():
     # Filter for running activities only
     try:
@@ -59,10 +62,17 @@ for index, row in df.iterrows():
 
             # Insert the activity into MongoDB
             collection.insert_one(activity)
+            uploaded_activities.append(activity)
             print(f"Uploaded: {activity['timestamp']} - {activity['distance']} km")
     except Exception as e:
         print(f"Error processing row {index}: {e}")
 
+# Update per-shoe/per-month pace sketches with the new activities
+update_pace_sketches(db, uploaded_activities)
+
+# Update daily rollups used by the comparison views
+update_daily_rollups(db, uploaded_activities)
+
 # Check if the data was inserted successfully 
 print("Documents in activities collection after insert:")
 for doc in collection.find():
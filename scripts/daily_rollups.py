@@ -0,0 +1,113 @@
+import os
+import pymongo
+import pandas as pd
+from datetime import datetime
+
+ROLLUP_COLLECTION = "daily_rollups"
+
+# Summed fields kept per day and shoe
+ROLLUP_FIELDS = ["runs", "distance_km", "paced_distance_km", "moving_minutes", "elevation_gain", "calories"]
+
+
+def _number(value):
+    """Return value as float, 0 for missing/NaN values."""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if value != value else value
+
+
+def build_daily_rollups(activities):
+    """Group activities into {(date, shoes): {field: total}}."""
+    rollups = {}
+    for activity in activities:
+        timestamp = activity.get("timestamp")
+        if timestamp is None:
+            continue
+
+        shoes = activity.get("shoes")
+        if not isinstance(shoes, str):
+            shoes = "Unknown"
+        day = datetime(timestamp.year, timestamp.month, timestamp.day)
+        totals = rollups.setdefault((day, shoes), {field: 0.0 for field in ROLLUP_FIELDS})
+
+        distance = _number(activity.get("distance"))
+        pace = _number(activity.get("avg_pace"))
+        totals["runs"] += 1
+        totals["distance_km"] += distance
+        # Moving time (min) = distance (km) * pace (min/km), used for weighted pace
+        if pace:
+            totals["paced_distance_km"] += distance
+            totals["moving_minutes"] += distance * pace
+        # FIT files store the ascent as "elevation"
+        totals["elevation_gain"] += _number(activity.get("elevation_gain", activity.get("elevation")))
+        totals["calories"] += _number(activity.get("calories"))
+    return rollups
+
+
+def update_daily_rollups(db, activities):
+    """Add new activities to the stored per-day/per-shoe rollups."""
+    collection = db.get_collection(ROLLUP_COLLECTION)
+    collection.create_index([("date", pymongo.ASCENDING), ("shoes", pymongo.ASCENDING)], unique=True)
+
+    for (day, shoes), totals in build_daily_rollups(activities).items():
+        collection.update_one(
+            {"date": day, "shoes": shoes},
+            {"$inc": totals},
+            upsert=True
+        )
+    print(f"Updated daily rollups for {len(activities)} activities")
+
+
+def rebuild_daily_rollups(db):
+    """Recompute all rollups from the activities collection."""
+    db.drop_collection(ROLLUP_COLLECTION)
+    update_daily_rollups(db, list(db.get_collection("activities").find()))
+
+
+def load_daily_rollups(start=None, end=None, shoes=None):
+    """Load rollups between start (inclusive) and end (exclusive) for a shoe or list of shoes (None = all but "Unknown")."""
+    uri = os.getenv("MongoDB_ConnectionString")  # Fetch URI from ENV VAR
+    client = pymongo.MongoClient(uri)
+    collection = client.get_database("strava_data").get_collection(ROLLUP_COLLECTION)
+
+    query = {}
+    if start or end:
+        query["date"] = {}
+        if start:
+            query["date"]["$gte"] = pd.Timestamp(start).to_pydatetime()
+        if end:
+            query["date"]["$lt"] = pd.Timestamp(end).to_pydatetime()
+    if isinstance(shoes, (list, tuple)):
+        query["shoes"] = {"$in": list(shoes)}
+    elif shoes is not None:
+        query["shoes"] = shoes
+    else:
+        query["shoes"] = {"$ne": "Unknown"}  # Same as the dashboard filter
+
+    rows = list(collection.find(query, {"_id": 0}))
+    df = pd.DataFrame(rows, columns=["date", "shoes"] + ROLLUP_FIELDS)
+    df['date'] = pd.to_datetime(df['date'])
+    return df
+
+
+def summarize_rollups(df, by=None):
+    """Sum rollups (optionally grouped) and derive avg pace in min/km."""
+    if by is None:
+        summary = df[ROLLUP_FIELDS].sum().to_frame().T
+    else:
+        summary = df.groupby(by)[ROLLUP_FIELDS].sum().reset_index()
+
+    # Pace weighted by distance (only runs with a pace)
+    distance = summary['paced_distance_km'].where(summary['paced_distance_km'] > 0)
+    summary['pace_min_per_km'] = summary['moving_minutes'] / distance
+    return summary
+
+
+if __name__ == "__main__":
+    # Backfill rollups from the existing activities
+    uri = os.getenv("MongoDB_ConnectionString")  # Fetch URI from ENV VAR
+    client = pymongo.MongoClient(uri)
+    rebuild_daily_rollups(client.get_database("strava_data"))
+    print("Daily rollups rebuilt successfully!")
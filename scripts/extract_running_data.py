@@ -3,6 +3,8 @@ import zipfile
 import pymongo
 from fitparse import FitFile
 from datetime import datetime
+from pace_sketches import update_pace_sketches
+from daily_rollups import update_daily_rollups
 
 # Mongo
 uri = os.getenv("MongoDB_ConnectionString")  # Fetch URI from ENV VAR
@@ -60,6 +62,7 @@ def parse_fit_file(fit_file):
     return None
 
 # Process .fit Files
+uploaded_activities = []
 for root, _, files in os.walk(extract_folder):
     for file in files:
         if file.endswith(".fit"):
@@ -68,6 +71,13 @@ for root, _, files in os.walk(extract_folder):
                 data = parse_fit_file(fit_file)
                 if data:
                     collection.insert_one(data)
+                    uploaded_activities.append(data)
                     print(f"Uploaded: {data['timestamp']}")
 
+# Update per-shoe/per-month pace sketches with the new activities
+update_pace_sketches(db, uploaded_activities)
+
+# Update daily rollups used by the comparison views
+update_daily_rollups(db, uploaded_activities)
+
 print("Running activities uploaded successfully!")
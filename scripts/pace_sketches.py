@@ -0,0 +1,230 @@
+import os
+import bisect
+import pymongo
+
+# Heart rate zones as % of max heart rate (Z1 starts at 50%)
+MAX_HEART_RATE = float(os.getenv("MAX_HEART_RATE", 190))  # Fetch max HR from ENV VAR
+HR_ZONES = [("Z1", 0.50), ("Z2", 0.60), ("Z3", 0.70), ("Z4", 0.80), ("Z5", 0.90)]
+
+SKETCH_COLLECTION = "pace_sketches"
+
+
+class PaceSketch:
+    """Mergeable quantile sketch (merging t-digest) of paces in min/km.
+
+    Keeps a few hundred weighted centroids at most (tuned by `compression`),
+    so a sketch for a shoe/month stays small and any combination can be answered by merging
+    sketches instead of sorting the raw history.
+    """
+
+    def __init__(self, compression=100, centroids=None, hr_zone_minutes=None):
+        self.compression = compression
+        self.centroids = [list(c) for c in (centroids or [])]  # [mean, weight], sorted by mean
+        self.hr_zone_minutes = {zone: 0.0 for zone, _ in HR_ZONES}
+        self.hr_zone_minutes.update(hr_zone_minutes or {})
+
+    @property
+    def count(self):
+        return sum(weight for _, weight in self.centroids)
+
+    def add(self, pace, weight=1):
+        """Add one pace value (min/km)."""
+        bisect.insort(self.centroids, [float(pace), float(weight)])
+        if len(self.centroids) > 2 * self.compression:
+            self._compress()
+
+    def add_hr_time(self, heart_rate, minutes):
+        """Add a run's time to the HR zone of its average heart rate."""
+        zone = heart_rate_zone(heart_rate)
+        if zone:
+            self.hr_zone_minutes[zone] += float(minutes)
+
+    def merge(self, other):
+        """Merge another sketch into this one (in place) and return self."""
+        self.centroids = sorted(self.centroids + [list(c) for c in other.centroids])
+        for zone, minutes in other.hr_zone_minutes.items():
+            self.hr_zone_minutes[zone] = self.hr_zone_minutes.get(zone, 0.0) + minutes
+        self._compress()
+        return self
+
+    def _compress(self):
+        """Merge neighbouring centroids, keeping the tails more precise."""
+        total = self.count
+        if total == 0:
+            return
+
+        merged = [list(self.centroids[0])]
+        cumulative = 0.0
+        for mean, weight in self.centroids[1:]:
+            current = merged[-1]
+            q_left = cumulative / total
+            q_right = (cumulative + current[1] + weight) / total
+            # Size limit shrinks towards q=0 and q=1 (t-digest k1 scale)
+            limit = 4 * total * min(q_left * (1 - q_left), q_right * (1 - q_right)) / self.compression
+            if current[1] + weight <= max(1.0, limit):
+                new_weight = current[1] + weight
+                current[0] += (mean - current[0]) * weight / new_weight
+                current[1] = new_weight
+            else:
+                cumulative += current[1]
+                merged.append([mean, weight])
+        self.centroids = merged
+
+    def quantile(self, q):
+        """Approximate pace at quantile q (0..1)."""
+        if not self.centroids:
+            return None
+        if len(self.centroids) == 1:
+            return self.centroids[0][0]
+
+        target = q * self.count
+        cumulative = 0.0
+        previous_center, previous_mean = None, None
+        for mean, weight in self.centroids:
+            center = cumulative + weight / 2
+            if target <= center:
+                if previous_center is None:
+                    return mean
+                # Interpolate between neighbouring centroid centers
+                fraction = (target - previous_center) / (center - previous_center)
+                return previous_mean + fraction * (mean - previous_mean)
+            previous_center, previous_mean = center, mean
+            cumulative += weight
+        return self.centroids[-1][0]
+
+    def percentiles(self, qs=(0.1, 0.5, 0.9)):
+        """Return {"p10": ..., "p50": ..., "p90": ...} style dict."""
+        return {f"p{round(q * 100)}": self.quantile(q) for q in qs}
+
+    def histogram(self, bins=20):
+        """Approximate histogram from the centroids, returns (counts, edges)."""
+        if not self.centroids:
+            return [], []
+        low, high = self.centroids[0][0], self.centroids[-1][0]
+        if low == high:
+            # Single value, give the bar a visible width
+            return [self.count], [low - 0.05, high + 0.05]
+
+        width = (high - low) / bins
+        edges = [low + i * width for i in range(bins + 1)]
+        counts = [0.0] * bins
+        for mean, weight in self.centroids:
+            counts[min(int((mean - low) / width), bins - 1)] += weight
+        return counts, edges
+
+    def to_dict(self):
+        return {
+            "compression": self.compression,
+            "centroids": self.centroids,
+            "hr_zone_minutes": self.hr_zone_minutes,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            compression=data.get("compression", 100),
+            centroids=data.get("centroids"),
+            hr_zone_minutes=data.get("hr_zone_minutes"),
+        )
+
+
+def _number(value):
+    """Return value as float, 0 for missing/NaN values."""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if value != value else value
+
+
+def heart_rate_zone(heart_rate):
+    """Return the HR zone name for an average heart rate, None if below Z1."""
+    try:
+        ratio = float(heart_rate) / MAX_HEART_RATE
+    except (TypeError, ValueError):
+        return None
+    if ratio != ratio:  # NaN
+        return None
+
+    zone_name = None
+    for zone, lower_bound in HR_ZONES:
+        if ratio >= lower_bound:
+            zone_name = zone
+    return zone_name
+
+
+def build_sketches(activities):
+    """Group activities into {(shoes, "YYYY-MM"): PaceSketch}."""
+    sketches = {}
+    for activity in activities:
+        pace = _number(activity.get("avg_pace"))
+        timestamp = activity.get("timestamp")
+        if not pace or timestamp is None:
+            continue
+
+        shoes = activity.get("shoes")
+        if not isinstance(shoes, str):
+            shoes = "Unknown"
+        key = (shoes, timestamp.strftime("%Y-%m"))
+        sketch = sketches.setdefault(key, PaceSketch())
+        sketch.add(pace)
+
+        # Run time (min) = distance (km) * pace (min/km), counted in the zone of the avg HR
+        distance = _number(activity.get("distance"))
+        sketch.add_hr_time(activity.get("average_heart_rate"), distance * pace)
+    return sketches
+
+
+def update_pace_sketches(db, activities):
+    """Merge new activities into the stored per-shoe/per-month sketches."""
+    collection = db.get_collection(SKETCH_COLLECTION)
+    collection.create_index([("shoes", pymongo.ASCENDING), ("month", pymongo.ASCENDING)], unique=True)
+
+    for (shoes, month), sketch in build_sketches(activities).items():
+        stored = collection.find_one({"shoes": shoes, "month": month})
+        if stored:
+            sketch = PaceSketch.from_dict(stored["sketch"]).merge(sketch)
+        collection.update_one(
+            {"shoes": shoes, "month": month},
+            {"$set": {"sketch": sketch.to_dict(), "count": sketch.count}},
+            upsert=True
+        )
+        print(f"Updated pace sketch: {shoes} - {month}")
+
+
+def rebuild_pace_sketches(db):
+    """Recompute all sketches from the activities collection."""
+    db.drop_collection(SKETCH_COLLECTION)
+    update_pace_sketches(db, list(db.get_collection("activities").find()))
+
+
+def load_pace_sketch(shoes=None, start_month=None, end_month=None):
+    """Merge stored sketches for a shoe or list of shoes (None = all) and month range ("YYYY-MM", inclusive)."""
+    uri = os.getenv("MongoDB_ConnectionString")  # Fetch URI from ENV VAR
+    client = pymongo.MongoClient(uri)
+    collection = client.get_database("strava_data").get_collection(SKETCH_COLLECTION)
+
+    query = {}
+    if isinstance(shoes, (list, tuple)):
+        query["shoes"] = {"$in": list(shoes)}
+    elif shoes is not None:
+        query["shoes"] = shoes
+    if start_month or end_month:
+        query["month"] = {}
+        if start_month:
+            query["month"]["$gte"] = start_month
+        if end_month:
+            query["month"]["$lte"] = end_month
+
+    merged = PaceSketch()
+    for doc in collection.find(query, {"sketch": 1}):
+        merged.merge(PaceSketch.from_dict(doc["sketch"]))
+    return merged
+
+
+if __name__ == "__main__":
+    # Backfill sketches from the existing activities
+    uri = os.getenv("MongoDB_ConnectionString")  # Fetch URI from ENV VAR
+    client = pymongo.MongoClient(uri)
+    rebuild_pace_sketches(client.get_database("strava_data"))
+    print("Pace sketches rebuilt successfully!")
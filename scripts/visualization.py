@@ -241,6 +241,105 @@ def plot_fastest_pace_per_shoe(df):
 
     return fig
 
+# Histogram with percentiles for pace + bar chart for run time by avg HR zone
+def plot_pace_distribution(sketch, title="Pace Distribution"):
+    """Pace histogram with p10/p50/p90 and run time by average-HR zone, from a PaceSketch."""
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5), gridspec_kw={'width_ratios': [2, 1]})
+
+    # Pastel blue histogram from the sketch centroids
+    pastel_blue = sns.color_palette("Blues")[2]
+    counts, edges = sketch.histogram(bins=20)
+    if counts:
+        widths = [right - left for left, right in zip(edges[:-1], edges[1:])]
+        ax1.bar(edges[:-1], counts, width=widths, align='edge', color=pastel_blue, edgecolor='white')
+
+        # Percentile lines
+        pastel_red = sns.color_palette("Reds")[2]
+        for label, pace in sketch.percentiles().items():
+            ax1.axvline(pace, color=pastel_red, linestyle='dashed')
+            ax1.text(pace, max(counts), f"{label}\n{format_pace(pace)}",
+                     horizontalalignment='center', verticalalignment='bottom', fontsize=10)
+        ax1.set_ylim(top=max(counts) * 1.25)  # Avoid text at upper border
+
+        # Pace axis in mm:ss
+        ax1.xaxis.set_major_locator(MaxNLocator(nbins=6))
+        ax1.set_xticks(ax1.get_xticks())
+        ax1.set_xticklabels([format_pace(p) for p in ax1.get_xticks()])
+
+    ax1.set_xlabel("Pace (min/km)")
+    ax1.set_ylabel("Runs")
+
+    # Pastel green bars for run time by average-HR zone
+    pastel_green = sns.color_palette("Greens")[2]
+    zones = list(sketch.hr_zone_minutes.keys())
+    hours = [minutes / 60 for minutes in sketch.hr_zone_minutes.values()]
+    ax2.bar(zones, hours, color=pastel_green)
+    ax2.set_xlabel("Avg Heart Rate Zone")
+    ax2.set_ylabel("Run Time (h)")
+
+    fig.suptitle(title, fontsize=18)
+    fig.tight_layout()
+
+    return fig
+
+# Labels for the comparison charts
+COMPARISON_METRICS = {
+    'distance_km': "Distance (km)",
+    'pace_min_per_km': "Avg Pace (min/km)",
+    'elevation_gain': "Elevation Gain (m)",
+    'calories': "Calories",
+}
+
+# Line chart overlaying the same month/week across years
+def plot_year_over_year(summary, metric, period="month"):
+    """Overlay a metric per month/week for each year, summary has 'year' and 'period' columns."""
+    fig, ax = plt.subplots(figsize=(10, 5))
+
+    years = sorted(summary['year'].unique())
+    pastel_colors = sns.color_palette("pastel", len(years))
+    for color, year in zip(pastel_colors, years):
+        year_stats = summary[summary['year'] == year].sort_values('period')
+        ax.plot(year_stats['period'], year_stats[metric], marker='o', color=color, label=str(year))
+
+    ax.set_xlabel(period.capitalize())
+    ax.set_ylabel(COMPARISON_METRICS[metric])
+    ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+
+    # Pace axis in mm:ss
+    if metric == 'pace_min_per_km':
+        ax.yaxis.set_major_locator(MaxNLocator(nbins=5))
+        ax.set_yticks(ax.get_yticks())
+        ax.set_yticklabels([format_pace(p) for p in ax.get_yticks()])
+
+    ax.legend(title="Year")
+    ax.set_title(f"{COMPARISON_METRICS[metric]} - Year over Year", fontsize=18, loc='center', pad=20)
+
+    return fig
+
+# Bar charts comparing two date ranges
+def plot_period_comparison(summary_a, summary_b, label_a, label_b):
+    """Bar charts for distance, pace, elevation and calories of two periods."""
+    fig, axes = plt.subplots(1, len(COMPARISON_METRICS), figsize=(12, 5))
+    pastel_colors = sns.color_palette("pastel")[:2]
+
+    for ax, (metric, label) in zip(axes, COMPARISON_METRICS.items()):
+        values = [summary_a[metric].iloc[0], summary_b[metric].iloc[0]]
+        values = [0 if pd.isna(value) else value for value in values]
+        ax.bar([label_a, label_b], values, color=pastel_colors)
+
+        # Num
+        for i, value in enumerate(values):
+            text = format_pace(value) if metric == 'pace_min_per_km' else f"{value:.0f}"
+            ax.text(i, value, text, horizontalalignment='center', verticalalignment='bottom', fontsize=10)
+
+        ax.set_title(label, fontsize=12)
+        ax.set_yticks([])
+
+    fig.suptitle("Period Comparison", fontsize=18)
+    fig.tight_layout()
+
+    return fig
+
 if __name__ == "__main__":
     from data_loader import load_running_data
     df = load_running_data()